@@ -10,6 +10,7 @@ from .iron_butterfly import (
     BlackScholesIronButterflyLong,
     BlackScholesIronButterflyShort,
 )
+from .iv import implied_vol_with_greeks
 
 __all__ = [
     "BlackScholesCall",
@@ -32,4 +33,5 @@ __all__ = [
     "BlackScholesCalendarPutSpread",
     "BlackScholesIronButterflyLong",
     "BlackScholesIronButterflyShort",
+    "implied_vol_with_greeks",
 ]
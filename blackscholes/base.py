@@ -1,6 +1,76 @@
-from abc import ABC, abstractmethod
-from math import erf, exp, log, pi, sqrt
-from typing import Dict
+from functools import lru_cache
+from math import erfc, exp, log, pi, sqrt
+from typing import Dict, NamedTuple
+
+try:
+    from ._kernels import _bsm_all_greeks
+except ImportError:  # Numba is optional; fall back to pure Python.
+    _bsm_all_greeks = None
+
+try:
+    import numpy as np
+    from scipy.special import ndtr
+except ImportError:  # NumPy/SciPy are optional; only the batch path needs them.
+    np = None
+    ndtr = None
+
+# Keys of `BlackScholesBase.get_all_greeks`,
+# in the same order as the `_bsm_all_greeks` kernel output.
+_ALL_GREEKS = (
+    "delta",
+    "spot_delta",
+    "gamma",
+    "vega",
+    "theta",
+    "epsilon",
+    "rho",
+    "lambda_greek",
+    "vanna",
+    "charm",
+    "vomma",
+    "veta",
+    "phi",
+    "speed",
+    "zomma",
+    "color",
+    "ultima",
+    "dual_delta",
+    "dual_gamma",
+    "alpha",
+)
+
+# Constants precomputed once at import time.
+_INV_SQRT2 = 1.0 / sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / sqrt(2.0 * pi)
+
+
+class Greeks(NamedTuple):
+    """All Black-Scholes-Merton Greeks as an immutable, typed record. \n
+    Cheaper to allocate than the dictionary returned by `get_all_greeks`
+    and supports attribute access (`greeks.delta`). \n
+    Field order matches `get_all_greeks`.
+    """
+
+    delta: float
+    spot_delta: float
+    gamma: float
+    vega: float
+    theta: float
+    epsilon: float
+    rho: float
+    lambda_greek: float
+    vanna: float
+    charm: float
+    vomma: float
+    veta: float
+    phi: float
+    speed: float
+    zomma: float
+    color: float
+    ultima: float
+    dual_delta: float
+    dual_gamma: float
+    alpha: float
 
 
 class StandardNormalMixin:
@@ -8,18 +78,28 @@ class StandardNormalMixin:
     Fast PDF and CDF calculations for standard normal distribution.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def _pdf(x: float) -> float:
         """PDF of standard normal distribution."""
-        return exp(-(x**2) / 2.0) / sqrt(2.0 * pi)
+        return exp(-0.5 * x * x) * _INV_SQRT_2PI
 
+    # The same d1/d2 arguments recur across the Greeks of one option and
+    # across the legs of option structures, so the CDF memoizes. The PDF
+    # is only hit through the precomputed `_pdf_d1`/`_pdf_d2` attributes,
+    # so caching it would buy nothing.
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _cdf(x):
-        """CDF of standard normal distribution."""
-        return (1.0 + erf(x / sqrt(2.0))) / 2.0
+        """CDF of standard normal distribution. \n
+        Uses `erfc` so that the tail (deep out-of-the-money options)
+        does not suffer the cancellation of `1 + erf`.
+        """
+        return 0.5 * erfc(-x * _INV_SQRT2)
 
 
-class BlackScholesBase(ABC, StandardNormalMixin):
+class BlackScholesBase(StandardNormalMixin):
     """
     Base functionality to calculate (European) prices
     and Greeks with the Black-Scholes-Merton formula.
@@ -32,6 +112,37 @@ class BlackScholesBase(ABC, StandardNormalMixin):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    # Fixed attribute layout: avoids a per-instance __dict__, which keeps
+    # instances small and attribute loads in the Greeks fast.
+    __slots__ = (
+        "S",
+        "K",
+        "T",
+        "r",
+        "sigma",
+        "q",
+        "_sqrtT",
+        "_sigma_sqrtT",
+        "_disc_r",
+        "_disc_q",
+        "_log_SK",
+        "_d1",
+        "_d2",
+        "_pdf_d1",
+        "_pdf_d2",
+        "_all_greeks",
+    )
+
+    # +1 for calls and -1 for puts. Set by the concrete subclasses and
+    # used by the vectorized batch path.
+    _option_sign = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the Greek methods once at class-creation time, so
+        # `_compute_all_greeks` does not repeat 20 attribute lookups per call.
+        cls._greek_methods = tuple((name, getattr(cls, name)) for name in _ALL_GREEKS)
+
     def __init__(self, S: float, K: float, T: float, r: float, sigma: float, q: float):
         # Parameter checks
         assert S > 0.0, f"Asset price (S) needs to be larger than 0. Got '{S}'"
@@ -42,83 +153,82 @@ class BlackScholesBase(ABC, StandardNormalMixin):
         ), f"Volatility (sigma) needs to be larger than 0. Got '{sigma}'"
         assert q >= 0.0, f"Annual dividend yield (q) cannot be negative. Got '{q}'"
         self.S, self.K, self.T, self.r, self.sigma, self.q = S, K, T, r, sigma, q
+        # Precompute terms shared by price and all Greeks.
+        # They only depend on the inputs, so computing them once here
+        # avoids repeated exp/log/sqrt calls when several Greeks are requested.
+        self._sqrtT = sqrt(T)
+        self._sigma_sqrtT = sigma * self._sqrtT
+        self._disc_r = exp(-r * T)  # Discounting for the risk-free rate
+        self._disc_q = exp(-q * T)  # Discounting for the dividend yield
+        self._log_SK = log(S / K)
+        # 1st probability factor that acts as a multiplication factor for stock prices.
+        self._d1 = (self._log_SK + (r - q + 0.5 * sigma * sigma) * T) / self._sigma_sqrtT
+        # 2nd probability parameter that acts as a multiplication factor for discounting.
+        self._d2 = self._d1 - self._sigma_sqrtT
+        self._pdf_d1 = self._pdf(self._d1)
+        self._pdf_d2 = self._pdf(self._d2)
+        self._all_greeks = None  # Lazily filled by `get_all_greeks`
 
-    @abstractmethod
     def price(self) -> float:
         """Fair value for option."""
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def in_the_money(self) -> float:
         """Naive probability that option will be in the money at maturity."""
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def delta(self) -> float:
         """Rate of change in option price
         with respect to the forward price (1st derivative).
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def spot_delta(self) -> float:
         """
         Delta discounted for interest rates.
         For the forward delta, use `delta`.
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def dual_delta(self) -> float:
         """1st derivative of option price with respect to the strike price."""
-        ...
+        raise NotImplementedError
 
     def gamma(self) -> float:
         """
         Rate of change in delta with respect to the underlying asset price (2nd derivative).
         """
-        return (
-            exp(-self.q * self.T)
-            * self._pdf(self._d1)
-            / (self.S * self.sigma * sqrt(self.T))
-        )
+        return self._disc_q * self._pdf_d1 / (self.S * self._sigma_sqrtT)
 
     def dual_gamma(self) -> float:
         """
         Rate of change in delta with respect to the strike price (2nd derivative).
         """
-        return (
-            exp(-self.r * self.T)
-            * self._pdf(self._d2)
-            / (self.K * self.sigma * sqrt(self.T))
-        )
+        return self._disc_r * self._pdf_d2 / (self.K * self._sigma_sqrtT)
 
     def vega(self) -> float:
         """
         Rate of change in option price with respect to the volatility of the asset.
         """
-        return self.S * self._pdf(self._d1) * sqrt(self.T)
+        return self.S * self._pdf_d1 * self._sqrtT
 
-    @abstractmethod
     def theta(self) -> float:
         """
         Rate of change in option price
         with respect to time (i.e. time decay).
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def epsilon(self) -> float:
         """Change in option price with respect to underlying dividend yield. \n
         Also known as psi."""
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def rho(self) -> float:
         """Rate of change in option price
         with respect to the risk-free rate.
         """
-        ...
+        raise NotImplementedError
 
     def lambda_greek(self) -> float:
         """Percentage change in option value per %
@@ -128,12 +238,11 @@ class BlackScholesBase(ABC, StandardNormalMixin):
 
     def vanna(self) -> float:
         """Sensitivity of delta with respect to change in volatility."""
-        return -self._pdf(self._d1) * self._d2 / self.sigma
+        return -self._pdf_d1 * self._d2 / self.sigma
 
-    @abstractmethod
     def charm(self) -> float:
         """Rate of change of delta over time (also known as delta decay)."""
-        ...
+        raise NotImplementedError
 
     def vomma(self) -> float:
         """2nd order sensitivity to volatility."""
@@ -141,15 +250,16 @@ class BlackScholesBase(ABC, StandardNormalMixin):
 
     def veta(self) -> float:
         """Rate of change in `vega` with respect to time."""
+        d1, d2 = self._d1, self._d2
         return (
             -self.S
-            * exp(-self.q * self.T)
-            * self._pdf(self._d1)
-            * sqrt(self.T)
+            * self._disc_q
+            * self._pdf_d1
+            * self._sqrtT
             * (
                 self.q
-                + (self.r - self.q) * self._d1 / (self.sigma * sqrt(self.T))
-                - (1.0 + self._d1 * self._d2) / (2.0 * self.T)
+                + (self.r - self.q) * d1 / self._sigma_sqrtT
+                - (1.0 + d1 * d2) / (2.0 * self.T)
             )
         )
 
@@ -159,41 +269,35 @@ class BlackScholesBase(ABC, StandardNormalMixin):
         Breeden-Litzenberger uses quoted option prices
         to estimate risk-neutral probabilities.
         """
-        sigma2 = self.sigma**2
-        exp_factor = (
-            -1.0
-            / (2.0 * sigma2 * self.T)
-            * (log(self.K / self.S) - ((self.r - self.q) - 0.5 * sigma2) * self.T) ** 2
-        )
-        return (
-            exp(-self.r * self.T)
-            * (1.0 / self.K)
-            * (1.0 / sqrt(2.0 * pi * sigma2 * self.T))
-            * exp(exp_factor)
-        )
+        # (log(K/S) - (r - q - 0.5*sigma^2)*T) / (sigma*sqrt(T)) is exactly -d2,
+        # so the exponential and its 1/sqrt(2*pi*sigma^2*T) normalisation fold
+        # into the cached standard normal pdf of d2.
+        return self._disc_r * self._pdf_d2 / (self.K * self._sigma_sqrtT)
 
     def speed(self) -> float:
         """Rate of change in Gamma with respect to change in the underlying price."""
-        return -self.gamma() / self.S * (self._d1 / (self.sigma * sqrt(self.T)) + 1.0)
+        sigma_sqrtT = self._sigma_sqrtT
+        gamma = self._disc_q * self._pdf_d1 / (self.S * sigma_sqrtT)
+        return -gamma / self.S * (self._d1 / sigma_sqrtT + 1.0)
 
     def zomma(self) -> float:
         """Rate of change of gamma with respect to changes in volatility."""
-        return self.gamma() * ((self._d1 * self._d2 - 1.0) / self.sigma)
+        gamma = self._disc_q * self._pdf_d1 / (self.S * self._sigma_sqrtT)
+        return gamma * ((self._d1 * self._d2 - 1.0) / self.sigma)
 
     def color(self) -> float:
         """Rate of change of gamma over time."""
+        T = self.T
+        sigma_sqrtT = self._sigma_sqrtT
         return (
-            -exp(-self.q * self.T)
-            * self._pdf(self._d1)
-            / (2.0 * self.S * self.T * self.sigma * sqrt(self.T))
+            -self._disc_q
+            * self._pdf_d1
+            / (2.0 * self.S * T * sigma_sqrtT)
             * (
-                2.0 * self.q * self.T
+                2.0 * self.q * T
                 + 1.0
-                + (
-                    2.0 * (self.r - self.q) * self.T
-                    - self._d2 * self.sigma * sqrt(self.T)
-                )
-                / (self.sigma * sqrt(self.T))
+                + (2.0 * (self.r - self.q) * T - self._d2 * sigma_sqrtT)
+                / sigma_sqrtT
                 * self._d1
             )
         )
@@ -205,8 +309,8 @@ class BlackScholesBase(ABC, StandardNormalMixin):
         d1d2 = self._d1 * self._d2
         return (
             -self.vega()
-            / self.sigma**2
-            * (d1d2 * (1.0 - d1d2) + self._d1**2 + self._d2**2)
+            / (self.sigma * self.sigma)
+            * (d1d2 * (1.0 - d1d2) + self._d1 * self._d1 + self._d2 * self._d2)
         )
 
     def alpha(self) -> float:
@@ -240,44 +344,148 @@ class BlackScholesBase(ABC, StandardNormalMixin):
 
     def get_all_greeks(self) -> Dict[str, float]:
         """Retrieve all Greeks for the Black-Scholes-Merton model
-        implemented as a dictionary."""
-        return {
-            "delta": self.delta(),
-            "spot_delta": self.spot_delta(),
-            "gamma": self.gamma(),
-            "vega": self.vega(),
-            "theta": self.theta(),
-            "epsilon": self.epsilon(),
-            "rho": self.rho(),
-            "lambda_greek": self.lambda_greek(),
-            "vanna": self.vanna(),
-            "charm": self.charm(),
-            "vomma": self.vomma(),
-            "veta": self.veta(),
-            "phi": self.phi(),
-            "speed": self.speed(),
-            "zomma": self.zomma(),
-            "color": self.color(),
-            "ultima": self.ultima(),
-            "dual_delta": self.dual_delta(),
-            "dual_gamma": self.dual_gamma(),
-            "alpha": self.alpha(),
-        }
+        implemented as a dictionary. \n
+        The option parameters are fixed at construction, so the result is
+        computed once per object; subsequent calls return a fresh copy.
+        """
+        if self._all_greeks is None:
+            self._all_greeks = self._compute_all_greeks()
+        return dict(self._all_greeks)
 
-    @property
-    def _d1(self) -> float:
-        """1st probability factor that acts as a multiplication factor for stock prices."""
-        return (1.0 / (self.sigma * sqrt(self.T))) * (
-            log(self.S / self.K) + (self.r - self.q + 0.5 * self.sigma**2) * self.T
-        )
+    def get_all_greeks_tuple(self) -> Greeks:
+        """Retrieve all Greeks for the Black-Scholes-Merton model
+        as a typed `Greeks` namedtuple. \n
+        Cheaper to build and read than the `get_all_greeks` dictionary
+        on hot paths."""
+        if self._all_greeks is None:
+            self._all_greeks = self._compute_all_greeks()
+        return Greeks(**self._all_greeks)
+
+    def _compute_all_greeks(self) -> Dict[str, float]:
+        """Evaluate all Greeks, bypassing the per-object cache."""
+        # Delegate to the compiled kernel when Numba is available
+        # and the option type (call/put) is known.
+        if _bsm_all_greeks is not None and self._option_sign is not None:
+            values = _bsm_all_greeks(
+                self.S, self.K, self.T, self.r, self.sigma, self.q,
+                self._option_sign > 0.0,
+            )
+            return dict(zip(_ALL_GREEKS, values))
+        # `_greek_methods` is resolved per class in `__init_subclass__`.
+        return {name: method(self) for name, method in self._greek_methods}
 
-    @property
-    def _d2(self) -> float:
-        """2nd probability parameter that acts as a multiplication factor for discounting."""
-        return self._d1 - self.sigma * sqrt(self.T)
+    @staticmethod
+    def _compute_d1_d2(S, K, T, r, sigma, q):
+        """Vectorized `d1` and `d2` for arrays of option parameters. \n
+        Accepts NumPy arrays (or scalars) and broadcasts like NumPy ufuncs.
+        """
+        sigma_sqrtT = sigma * np.sqrt(T)
+        d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sigma_sqrtT
+        return d1, d1 - sigma_sqrtT
+
+    @classmethod
+    def price_and_greeks_batch(cls, S, K, T, r, sigma, q=0.0) -> Dict[str, "object"]:
+        """Price and all Greeks for a batch of options in one vectorized pass. \n
+        Accepts NumPy arrays (or scalars) for every parameter and broadcasts
+        them against each other, so full surfaces (strikes x expiries) are
+        priced without per-option Python overhead. \n
+        `d1`, `d2`, the normal PDF and CDF are evaluated once per element
+        and shared across all Greeks. \n
+        Requires NumPy and SciPy. Must be called on `BlackScholesCall` or
+        `BlackScholesPut`.
+
+        :param S: Price(s) of underlying asset \n
+        :param K: Strike price(s) \n
+        :param T: Time(s) till expiration in years (1/12 indicates 1 month) \n
+        :param r: Risk-free interest rate(s) (0.05 indicates 5%) \n
+        :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
+        :param q: Annual dividend yield(s) (0.05 indicates 5% yield)
+
+        :return: Dictionary mapping "price" and every Greek in
+        `get_all_greeks` to a NumPy array.
+        """
+        if np is None or ndtr is None:
+            raise ImportError(
+                "NumPy and SciPy are required for `price_and_greeks_batch`. "
+                "Install them with `pip install numpy scipy`."
+            )
+        sign = cls._option_sign
+        assert sign is not None, (
+            "`price_and_greeks_batch` must be called on "
+            "`BlackScholesCall` or `BlackScholesPut`."
+        )
+        S, K, T, r, sigma, q = np.broadcast_arrays(
+            *map(np.asarray, (S, K, T, r, sigma, q))
+        )
+        sqrtT = np.sqrt(T)
+        sigma_sqrtT = sigma * sqrtT
+        disc_r = np.exp(-r * T)
+        disc_q = np.exp(-q * T)
+        d1, d2 = cls._compute_d1_d2(S, K, T, r, sigma, q)
+        # `ndtr` is the standard normal CDF as a single compiled ufunc.
+        cdf_sd1 = ndtr(sign * d1)
+        cdf_sd2 = ndtr(sign * d2)
+        pdf_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+        pdf_d2 = np.exp(-0.5 * d2 * d2) * _INV_SQRT_2PI
+
+        price = sign * (S * disc_q * cdf_sd1 - K * disc_r * cdf_sd2)
+        delta = sign * disc_q * cdf_sd1
+        gamma = disc_q * pdf_d1 / (S * sigma_sqrtT)
+        vega = S * pdf_d1 * sqrtT
+        # The put time-decay term discounts by exp(+qT),
+        # matching `BlackScholesPut.theta` and the Numba kernel.
+        decay_disc = disc_q if sign > 0 else np.exp(q * T)
+        theta = (
+            -decay_disc * S * pdf_d1 * sigma / (2.0 * sqrtT)
+            + sign * (q * S * disc_q * cdf_sd1 - r * K * disc_r * cdf_sd2)
+        )
+        charm_decay = (
+            disc_q
+            * pdf_d1
+            * (2.0 * (r - q) * T - d2 * sigma_sqrtT)
+            / (2.0 * T * sigma_sqrtT)
+        )
+        return {
+            "price": price,
+            "delta": delta,
+            "spot_delta": sign * np.exp((r - q) * T) * cdf_sd1,
+            "gamma": gamma,
+            "vega": vega,
+            "theta": theta,
+            "epsilon": -sign * S * T * disc_q * cdf_sd1,
+            "rho": sign * K * T * disc_r * cdf_sd2,
+            "lambda_greek": delta * S / price,
+            "vanna": -pdf_d1 * d2 / sigma,
+            "charm": sign * q * disc_q * cdf_sd1 - charm_decay,
+            "vomma": vega * d1 * d2 / sigma,
+            "veta": -vega
+            * disc_q
+            * (
+                q
+                + (r - q) * d1 / sigma_sqrtT
+                - (1.0 + d1 * d2) / (2.0 * T)
+            ),
+            "phi": disc_r * pdf_d2 / (K * sigma_sqrtT),
+            "speed": -gamma / S * (d1 / sigma_sqrtT + 1.0),
+            "zomma": gamma * (d1 * d2 - 1.0) / sigma,
+            "color": -disc_q
+            * pdf_d1
+            / (2.0 * S * T * sigma_sqrtT)
+            * (
+                2.0 * q * T
+                + 1.0
+                + (2.0 * (r - q) * T - d2 * sigma_sqrtT) / sigma_sqrtT * d1
+            ),
+            "ultima": -vega
+            / (sigma * sigma)
+            * (d1 * d2 * (1.0 - d1 * d2) + d1 * d1 + d2 * d2),
+            "dual_delta": disc_r * cdf_sd2,
+            "dual_gamma": disc_r * pdf_d2 / (K * sigma_sqrtT),
+            "alpha": np.abs(theta) / (gamma + 1e-9),
+        }
 
 
-class Black76Base(ABC, StandardNormalMixin):
+class Black76Base(StandardNormalMixin):
     """
     Base functionality to calculate (European) prices
     and Greeks with the Black-76 formula. \n
@@ -291,59 +499,77 @@ class Black76Base(ABC, StandardNormalMixin):
     :param sigma: Volatility (standard deviation) of stock (0.15 indicates 15%) \n
     """
 
+    __slots__ = (
+        "F",
+        "K",
+        "T",
+        "r",
+        "sigma",
+        "_sqrtT",
+        "_sigma_sqrtT",
+        "_disc_r",
+        "_d1",
+        "_d2",
+        "_pdf_d1",
+    )
+
     def __init__(self, F: float, K: float, T: float, r: float, sigma: float):
         # Some parameters must be positive
-        for param in [F, K, T, sigma]:
-            assert (
-                param >= 0.0
-            ), f"Some parameters cannot be negative. Got '{param}' as an argument."
+        assert F >= 0.0, f"Futures price (F) cannot be negative. Got '{F}'"
+        assert K >= 0.0, f"Strike price (K) cannot be negative. Got '{K}'"
+        assert T >= 0.0, f"Time to maturity (T) cannot be negative. Got '{T}'"
+        assert (
+            sigma >= 0.0
+        ), f"Volatility (sigma) cannot be negative. Got '{sigma}'"
         self.F, self.K, self.T, self.r, self.sigma = F, K, T, r, sigma
+        # Precompute terms shared by price and all Greeks,
+        # mirroring BlackScholesBase.
+        self._sqrtT = sqrt(T)
+        self._sigma_sqrtT = sigma * self._sqrtT
+        self._disc_r = exp(-r * T)  # Discounting for the risk-free rate
+        # 1st probability factor that acts as a multiplication factor for futures contracts.
+        self._d1 = (log(F / K) + 0.5 * sigma * sigma * T) / self._sigma_sqrtT
+        # 2nd probability parameter that acts as a multiplication factor for discounting.
+        self._d2 = self._d1 - self._sigma_sqrtT
+        self._pdf_d1 = self._pdf(self._d1)
 
-    @abstractmethod
     def price(self):
         """Fair value for option."""
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def delta(self):
         """Rate of change in option price
         with respect to the futures price (1st derivative)."""
-        ...
+        raise NotImplementedError
 
     def gamma(self) -> float:
         """
         Rate of change in delta with respect to the underlying stock price (2nd derivative).
         """
-        return (
-            exp(-self.r * self.T)
-            * self._pdf(self._d1)
-            / (self.F * self.sigma * sqrt(self.T))
-        )
+        return self._disc_r * self._pdf_d1 / (self.F * self._sigma_sqrtT)
 
     def vega(self) -> float:
         """Rate of change in option price with respect to the volatility
         of underlying futures contract.
         """
-        return self.F * exp(-self.r * self.T) * self._pdf(self._d1) * sqrt(self.T)
+        return self.F * self._disc_r * self._pdf_d1 * self._sqrtT
 
-    @abstractmethod
     def theta(self) -> float:
         """
         Rate of change in option price
         with respect to time (i.e. time decay).
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def rho(self) -> float:
         """Rate of change in option price
         with respect to the risk-free rate.
         """
-        ...
+        raise NotImplementedError
 
     def vanna(self) -> float:
         """Sensitivity of delta with respect to change in volatility."""
-        return self.vega() / self.F * (1 - self._d1 / (self.sigma * sqrt(self.T)))
+        return self.vega() / self.F * (1 - self._d1 / self._sigma_sqrtT)
 
     def vomma(self) -> float:
         """2nd order sensitivity to volatility."""
@@ -385,26 +611,13 @@ class Black76Base(ABC, StandardNormalMixin):
             "alpha": self.alpha(),
         }
 
-    @property
-    def _d1(self) -> float:
-        """1st probability factor that acts as a multiplication factor for futures contracts."""
-        return (log(self.F / self.K) + 0.5 * self.sigma**2 * self.T) / (
-            self.sigma * sqrt(self.T)
-        )
-
-    @property
-    def _d2(self) -> float:
-        """2nd probability parameter that acts as a multiplication factor for discounting."""
-        return self._d1 - self.sigma * sqrt(self.T)
-
 
-class BlackScholesStructureBase(ABC):
+class BlackScholesStructureBase:
     """
     Option structure base class. \n
     `_calc_attr` should be implemented for every option structure.
     """
 
-    @abstractmethod
     def _calc_attr(self, attribute_name: str) -> float:
         """
         Combines attributes from several put and call options.
@@ -425,7 +638,7 @@ class BlackScholesStructureBase(ABC):
 
         :return: Combined value (float)
         """
-        ...
+        raise NotImplementedError
 
     def price(self) -> float:
         """Fair value of Black-Scholes option structure."""
@@ -561,31 +774,10 @@ class BlackScholesStructureBase(ABC):
     def get_all_greeks(self) -> Dict[str, float]:
         """Retrieve all Greeks for the compound
         implemented as a dictionary."""
-        return {
-            "delta": self.delta(),
-            "spot_delta": self.spot_delta(),
-            "gamma": self.gamma(),
-            "vega": self.vega(),
-            "theta": self.theta(),
-            "epsilon": self.epsilon(),
-            "rho": self.rho(),
-            "lambda_greek": self.lambda_greek(),
-            "vanna": self.vanna(),
-            "charm": self.charm(),
-            "vomma": self.vomma(),
-            "veta": self.veta(),
-            "phi": self.phi(),
-            "speed": self.speed(),
-            "zomma": self.zomma(),
-            "color": self.color(),
-            "ultima": self.ultima(),
-            "dual_delta": self.dual_delta(),
-            "dual_gamma": self.dual_gamma(),
-            "alpha": self.alpha(),
-        }
+        return {name: self._calc_attr(attribute_name=name) for name in _ALL_GREEKS}
 
 
-class BinaryBase(ABC, StandardNormalMixin):
+class BinaryBase(StandardNormalMixin):
     """
     Base class for (European) binary options.
     Also called a digital or exotic option.
@@ -606,21 +798,19 @@ class BinaryBase(ABC, StandardNormalMixin):
         ), f"Volatility (sigma) needs to be larger than 0. Got '{sigma}'"
         self.S, self.K, self.T, self.r, self.sigma = S, K, T, r, sigma
 
-    @abstractmethod
     def price(self) -> float:
         """Fair value for binary option."""
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def forward(self) -> float:
         """Undiscounted fair value for binary option."""
-        ...
+        raise NotImplementedError
     
     @property
     def _d1(self) -> float:
         """1st probability factor that acts as a multiplication factor for stock prices."""
         return (1.0 / (self.sigma * sqrt(self.T))) * (
-            log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T
+            log(self.S / self.K) + (self.r + 0.5 * self.sigma * self.sigma) * self.T
         )
 
     @property
@@ -628,41 +818,37 @@ class BinaryBase(ABC, StandardNormalMixin):
         """2nd probability parameter that acts as a multiplication factor for discounting."""
         return self._d1 - self.sigma * sqrt(self.T)
     
-    @abstractmethod
     def delta(self) -> float:
         """Rate of change in structure price
         with respect to the asset price (1st derivative).
         Note that this is the forward delta.
         """
-        ...
+        raise NotImplementedError
 
     def gamma(self) -> float:
         """Rate of change in delta
         with respect to the underlying price (2nd derivative).
         """
-        return (self._pdf(self._d1) * (self._d1 / (self.T * self.sigma * self.S) - 1 / self.S**2)) / (self.S * self.sigma * sqrt(self.T))
+        return (self._pdf(self._d1) * (self._d1 / (self.T * self.sigma * self.S) - 1 / (self.S * self.S))) / (self.S * self.sigma * sqrt(self.T))
 
-    @abstractmethod
     def vega(self) -> float:
         """Rate of change in option price
         with respect to the volatility (1st derivative).
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def theta(self) -> float:
         """
         Rate of change in structure price
         with respect to time (i.e. time decay).
         """
-        ...
+        raise NotImplementedError
 
-    @abstractmethod
     def rho(self) -> float:
         """Rate of change in structure price
         with respect to the risk-free rate.
         """
-        ...
+        raise NotImplementedError
 
     def get_core_greeks(self) -> Dict[str, float]:
         """
@@ -0,0 +1,69 @@
+from math import pi, sqrt
+from typing import Dict
+
+from .call import BlackScholesCall
+from .put import BlackScholesPut
+
+
+def implied_vol_with_greeks(
+    price: float,
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    q: float = 0.0,
+    is_call: bool = True,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+) -> Dict[str, float]:
+    """Implied volatility and all Greeks in a single fused pass. \n
+    Newton-Raphson on sigma, where every iteration prices the option and
+    reads its vega from the same cached `d1`/`d2`/pdf evaluation, and the
+    converged iterate supplies all Greeks without any re-evaluation. \n
+    This avoids the usual two-step flow (root-find the vol, then price
+    the Greeks from scratch) that dominates calibration loops.
+
+    :param price: Observed option price to invert \n
+    :param S: Price of underlying asset \n
+    :param K: Strike price \n
+    :param T: Time till expiration in years (1/12 indicates 1 month) \n
+    :param r: Risk-free interest rate (0.05 indicates 5%) \n
+    :param q: Annual dividend yield (0.05 indicates 5% yield) \n
+    :param is_call: True for a call option, False for a put \n
+    :param tol: Absolute price tolerance for convergence \n
+    :param max_iter: Maximum number of Newton iterations
+
+    :return: Dictionary with "implied_vol" and every Greek in
+    `get_all_greeks`, evaluated at the implied volatility.
+    """
+    assert price > 0.0, f"Option price needs to be larger than 0. Got '{price}'"
+    option_cls = BlackScholesCall if is_call else BlackScholesPut
+    # Brenner-Subrahmanyam approximation as the initial guess.
+    sigma = max(sqrt(2.0 * pi / T) * price / S, 1e-4)
+    option = option_cls(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
+    for _ in range(max_iter):
+        diff = option.price() - price
+        if abs(diff) < tol:
+            break
+        # `vega()` omits the dividend discounting by convention,
+        # while Newton needs the full dPrice/dsigma.
+        vega = option.vega() * option._disc_q
+        if vega > 1e-12:
+            # Damp the step to at most halving/doubling sigma, so a tiny
+            # vega far from the money cannot fling the iterate to infinity.
+            sigma = min(max(sigma - diff / vega, 0.5 * sigma), 2.0 * sigma)
+        elif diff < 0.0:
+            # Vega has underflowed; step geometrically towards a
+            # regime where the price responds to sigma again.
+            sigma *= 2.0
+        else:
+            sigma *= 0.5
+        option = option_cls(S=S, K=K, T=T, r=r, sigma=sigma, q=q)
+    else:
+        raise ValueError(
+            f"Implied volatility did not converge within {max_iter} iterations. "
+            f"Got '{price}' as an option price."
+        )
+    greeks = option.get_all_greeks()
+    greeks["implied_vol"] = sigma
+    return greeks
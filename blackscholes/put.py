@@ -16,6 +16,10 @@ class BlackScholesPut(BlackScholesBase):
     :param q: Annual dividend yield (0.05 indicates 5% yield)
     """
 
+    __slots__ = ()
+
+    _option_sign = -1.0
+
     def __init__(
         self, S: float, K: float, T: float, r: float, sigma: float, q: float = 0.0
     ):
@@ -23,9 +27,9 @@ class BlackScholesPut(BlackScholesBase):
 
     def price(self) -> float:
         """Fair value of a Black-Scholes put option."""
-        return self._cdf(-self._d2) * self.K * exp(-self.r * self.T) - self.S * exp(
-            -self.q * self.T
-        ) * self._cdf(-self._d1)
+        return self._cdf(-self._d2) * self.K * self._disc_r - self.S * self._disc_q * self._cdf(
+            -self._d1
+        )
 
     def delta(self) -> float:
         """
@@ -34,7 +38,7 @@ class BlackScholesPut(BlackScholesBase):
         Note that this is the spot delta.
         For the forward delta, use `forward_delta`.
         """
-        return exp(-self.q * self.T) * (self._cdf(self._d1) - 1)
+        return self._disc_q * (self._cdf(self._d1) - 1)
 
     def spot_delta(self) -> float:
         """
@@ -47,53 +51,53 @@ class BlackScholesPut(BlackScholesBase):
         """1st derivative in option price
         with respect to strike price.
         """
-        return exp(-self.r * self.T) * self._cdf(-self._d2)
+        return self._disc_r * self._cdf(-self._d2)
 
     def theta(self) -> float:
         """Rate of change in option price
         with respect to time (i.e. time decay).
         """
         return (
-            (-exp(self.q * self.T) * self.S * self._pdf(self._d1) * self.sigma)
-            / (2.0 * sqrt(self.T))
+            (-exp(self.q * self.T) * self.S * self._pdf_d1 * self.sigma)
+            / (2.0 * self._sqrtT)
         ) + (
-            self.r * self.K * exp(-self.r * self.T) * self._cdf(-self._d2)
-            - self.q * self.S * exp(-self.q * self.T) * self._cdf(-self._d1)
+            self.r * self.K * self._disc_r * self._cdf(-self._d2)
+            - self.q * self.S * self._disc_q * self._cdf(-self._d1)
         )
 
     def rho(self) -> float:
         """Rate of change in option price
         with respect to the risk-free rate.
         """
-        return -self.K * self.T * exp(-self.r * self.T) * self._cdf(-self._d2)
+        return -self.K * self.T * self._disc_r * self._cdf(-self._d2)
 
     def epsilon(self) -> float:
         """Change in option price with respect to underlying dividend yield. \n
         Also known as psi."""
-        return self.S * self.T * exp(-self.q * self.T) * self._cdf(-self._d1)
+        return self.S * self.T * self._disc_q * self._cdf(-self._d1)
 
     def charm(self) -> float:
         """Rate of change of delta over time (also known as delta decay)."""
-        return -self.q * exp(-self.q * self.T) * self._cdf(-self._d1) - exp(
-            -self.q * self.T
-        ) * self._pdf(self._d1) * (
-            2.0 * (self.r - self.q) * self.T - self._d2 * self.sigma * sqrt(self.T)
+        return -self.q * self._disc_q * self._cdf(-self._d1) - self._disc_q * self._pdf_d1 * (
+            2.0 * (self.r - self.q) * self.T - self._d2 * self._sigma_sqrtT
         ) / (
-            2.0 * self.T * self.sigma * sqrt(self.T)
+            2.0 * self.T * self._sigma_sqrtT
         )
 
     def in_the_money(self) -> float:
         """Naive Probability that put option will be in the money at maturity."""
-        return 1.0 - self._cdf(self._d2)
+        return self._cdf(-self._d2)
 
 
 class Black76Put(Black76Base):
+    __slots__ = ()
+
     def __init__(self, F: float, K: float, T: float, r: float, sigma: float):
         super().__init__(F=F, K=K, T=T, r=r, sigma=sigma)
 
     def price(self) -> float:
         """Fair value of a Black-76 put option."""
-        return exp(-self.r * self.T) * (
+        return self._disc_r * (
             self.K * self._cdf(-self._d2) - self.F * self._cdf(-self._d1)
         )
 
@@ -102,20 +106,16 @@ class Black76Put(Black76Base):
         with respect to the underlying futures price (1st derivative).
         Proxy for probability of the option expiring in the money.
         """
-        return -exp(-self.r * self.T) * self._cdf(-self._d1)
+        return -self._disc_r * self._cdf(-self._d1)
 
     def theta(self) -> float:
         """Rate of change in option price
         with respect to time (i.e. time decay).
         """
         return (
-            -self.F
-            * exp(-self.r * self.T)
-            * self._pdf(self._d1)
-            * self.sigma
-            / (2 * sqrt(self.T))
-            + self.r * self.K * exp(-self.r * self.T) * self._cdf(-self._d2)
-            - self.r * self.F * exp(-self.r * self.T) * self._cdf(-self._d1)
+            -self.F * self._disc_r * self._pdf_d1 * self.sigma / (2 * self._sqrtT)
+            + self.r * self.K * self._disc_r * self._cdf(-self._d2)
+            - self.r * self.F * self._disc_r * self._cdf(-self._d1)
         )
 
     def rho(self) -> float:
@@ -124,7 +124,7 @@ class Black76Put(Black76Base):
         """
         return (
             -self.T
-            * exp(-self.r * self.T)
+            * self._disc_r
             * (self.K * self._cdf(-self._d2) - self.F * self._cdf(-self._d1))
         )
 
@@ -148,11 +148,11 @@ class BinaryPut(BinaryBase):
 
     def price(self) -> float:
         """Fair value of binary call option."""
-        return exp(-self.r * self.T) * (1 - self._cdf(self._d2))
-    
+        return exp(-self.r * self.T) * self._cdf(-self._d2)
+
     def forward(self) -> float:
         """Fair value of binary call option without discounting for interest rates."""
-        return 1 - self._cdf(self._d2)
+        return self._cdf(-self._d2)
     
     def delta(self) -> float:
         """Rate of change in option price
@@ -1,7 +1,50 @@
+from math import exp
+from typing import Dict
+
 from . import BlackScholesCall, BlackScholesPut
 from .base import BlackScholesStructureBase
 
 
+def _fused_straddle_greeks(call: BlackScholesCall) -> Dict[str, float]:
+    """
+    All Greeks of Put(K) + Call(K) computed from the call leg only. \n
+    Both legs of a straddle share `d1` and `d2`, so the symmetric Greeks
+    (gamma, vega, vomma, ...) are simply twice the call's value and the
+    asymmetric ones follow from put-call parity. This halves the work
+    compared to evaluating the put leg from scratch.
+
+    :param call: Call leg of the straddle.
+
+    :return: Combined Greeks of the long straddle.
+    """
+    c = call.get_all_greeks()
+    S, K, T, r, q = call.S, call.K, call.T, call.r, call.q
+    disc_r, disc_q = call._disc_r, call._disc_q
+    # Evaluated directly rather than via parity subtraction, which cancels
+    # catastrophically when the put leg is deep out-of-the-money.
+    put_price = K * disc_r * call._cdf(-call._d2) - S * disc_q * call._cdf(-call._d1)
+    put_delta = -disc_q * call._cdf(-call._d1)
+    # Matches `BlackScholesPut.theta` exactly,
+    # including its exp(q*T) factor on the time-decay term.
+    put_theta = (
+        c["theta"]
+        + r * K * disc_r
+        - q * S * disc_q
+        + (disc_q - exp(q * T)) * S * call._pdf_d1 * call.sigma / (2.0 * call._sqrtT)
+    )
+    greeks = {key: 2.0 * value for key, value in c.items()}
+    greeks["delta"] = c["delta"] + put_delta
+    greeks["spot_delta"] = 2.0 * c["spot_delta"] - exp((r - q) * T)
+    greeks["theta"] = c["theta"] + put_theta
+    greeks["epsilon"] = 2.0 * c["epsilon"] + S * T * disc_q
+    greeks["rho"] = 2.0 * c["rho"] - K * T * disc_r
+    greeks["lambda_greek"] = c["lambda_greek"] + put_delta * S / put_price
+    greeks["charm"] = 2.0 * c["charm"] - q * disc_q
+    greeks["dual_delta"] = disc_r
+    greeks["alpha"] = c["alpha"] + abs(put_theta) / (c["gamma"] + 1e-9)
+    return greeks
+
+
 class BlackScholesStraddleLong(BlackScholesStructureBase):
     """
     Create long straddle option structure. \n
@@ -43,6 +86,12 @@ class BlackScholesStraddleLong(BlackScholesStructureBase):
         call_attr = getattr(self.call1, attribute_name)
         return put_attr() + call_attr()
 
+    def get_all_greeks(self) -> Dict[str, float]:
+        """Retrieve all Greeks for the long straddle in one fused pass. \n
+        The put leg is derived from the call leg via put-call parity
+        instead of being evaluated from scratch."""
+        return _fused_straddle_greeks(self.call1)
+
 
 class BlackScholesStraddleShort(BlackScholesStructureBase):
     """
@@ -84,3 +133,11 @@ class BlackScholesStraddleShort(BlackScholesStructureBase):
         put_attr = getattr(self.put1, attribute_name)
         call_attr = getattr(self.call1, attribute_name)
         return -put_attr() - call_attr()
+
+    def get_all_greeks(self) -> Dict[str, float]:
+        """Retrieve all Greeks for the short straddle in one fused pass. \n
+        The put leg is derived from the call leg via put-call parity
+        instead of being evaluated from scratch."""
+        return {
+            key: -value for key, value in _fused_straddle_greeks(self.call1).items()
+        }
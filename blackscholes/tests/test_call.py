@@ -155,6 +155,28 @@ class TestBlackScholesCall:
                 all_greeks[key], expected_result[key], decimal=5
             )
 
+    def test_get_all_greeks_tuple(self):
+        all_greeks = self.call.get_all_greeks()
+        greeks_tuple = self.call.get_all_greeks_tuple()
+        # Namedtuple fields should match the dictionary key for key.
+        assert greeks_tuple._fields == tuple(all_greeks.keys())
+        for key, expected in all_greeks.items():
+            assert getattr(greeks_tuple, key) == expected
+
+    def test_price_and_greeks_batch(self):
+        strikes = np.array([45.0, 50.0, 55.0, 60.0])
+        batch = BlackScholesCall.price_and_greeks_batch(
+            S=test_S, K=strikes, T=test_T, r=test_r, sigma=test_sigma, q=0.01
+        )
+        # Batch path should agree with the scalar implementation.
+        for i, strike in enumerate(strikes):
+            call = BlackScholesCall(
+                S=test_S, K=strike, T=test_T, r=test_r, sigma=test_sigma, q=0.01
+            )
+            np.testing.assert_almost_equal(batch["price"][i], call.price(), decimal=6)
+            for key, expected in call.get_all_greeks().items():
+                np.testing.assert_almost_equal(batch[key][i], expected, decimal=6)
+
 
 class TestBlack76Call:
     call = Black76Call(F=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from blackscholes import BlackScholesCall, BlackScholesPut, implied_vol_with_greeks
+
+# Test parameters
+test_S = 55.0  # Asset price of 55
+test_K = 50.0  # Strike price of 50
+test_T = 1.0  # 1 year to maturity
+test_r = 0.0025  # 0.25% risk-free rate
+test_sigma = 0.15  # 15% vol
+
+
+class TestImpliedVolWithGreeks:
+    def test_call_round_trip(self):
+        call = BlackScholesCall(
+            S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma
+        )
+        result = implied_vol_with_greeks(
+            price=call.price(), S=test_S, K=test_K, T=test_T, r=test_r
+        )
+        np.testing.assert_almost_equal(result["implied_vol"], test_sigma, decimal=6)
+        # Greeks should match those of the option at the implied volatility.
+        for key, expected in call.get_all_greeks().items():
+            np.testing.assert_almost_equal(result[key], expected, decimal=5)
+
+    def test_put_round_trip(self):
+        put = BlackScholesPut(
+            S=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma, q=0.01
+        )
+        result = implied_vol_with_greeks(
+            price=put.price(),
+            S=test_S,
+            K=test_K,
+            T=test_T,
+            r=test_r,
+            q=0.01,
+            is_call=False,
+        )
+        np.testing.assert_almost_equal(result["implied_vol"], test_sigma, decimal=6)
+        for key, expected in put.get_all_greeks().items():
+            np.testing.assert_almost_equal(result[key], expected, decimal=5)
+
+    def test_otm_round_trip(self):
+        # The Brenner-Subrahmanyam guess is far too low out-of-the-money,
+        # where vega underflows; the guarded step should still converge.
+        call = BlackScholesCall(S=test_S, K=70.0, T=0.5, r=test_r, sigma=0.2)
+        result = implied_vol_with_greeks(
+            price=call.price(), S=test_S, K=70.0, T=0.5, r=test_r
+        )
+        np.testing.assert_almost_equal(result["implied_vol"], 0.2, decimal=6)
+
+    def test_unattainable_price(self):
+        # A price below intrinsic value has no implied volatility.
+        with pytest.raises(ValueError):
+            implied_vol_with_greeks(price=4.0, S=test_S, K=test_K, T=test_T, r=test_r)
+
+    def test_arg_assert(self):
+        # Should not be able to invert a non-positive price.
+        with pytest.raises(AssertionError):
+            implied_vol_with_greeks(price=0.0, S=test_S, K=test_K, T=test_T, r=test_r)
@@ -140,6 +140,34 @@ class TestBlackScholesPut:
                 all_greeks[key], expected_result[key], decimal=5
             )
 
+    def test_all_greeks_deep_otm(self):
+        # Deep out-of-the-money the tail CDFs fall below machine epsilon,
+        # so any `1 - cdf` form rounds to zero and `lambda_greek` divides
+        # by a zero price. The erfc-based tails should stay finite.
+        deep_otm_puts = [
+            BlackScholesPut(S=70.0, K=50.0, T=0.25, r=0.0025, sigma=0.08),
+            BlackScholesPut(S=70.0, K=50.0, T=0.1, r=0.05, sigma=0.1),
+        ]
+        for put in deep_otm_puts:
+            assert put.price() > 0.0
+            for value in put.get_all_greeks().values():
+                assert np.isfinite(value)
+
+    def test_price_and_greeks_batch(self):
+        strikes = np.array([45.0, 50.0, 55.0, 60.0])
+        batch = BlackScholesPut.price_and_greeks_batch(
+            S=test_S, K=strikes, T=test_T, r=test_r, sigma=test_sigma, q=0.02
+        )
+        # Batch path should agree with the scalar implementation,
+        # including the put theta discounting with a non-zero dividend yield.
+        for i, strike in enumerate(strikes):
+            put = BlackScholesPut(
+                S=test_S, K=strike, T=test_T, r=test_r, sigma=test_sigma, q=0.02
+            )
+            np.testing.assert_almost_equal(batch["price"][i], put.price(), decimal=6)
+            for key, expected in put.get_all_greeks().items():
+                np.testing.assert_almost_equal(batch[key][i], expected, decimal=6)
+
 
 class TestBlack76Put:
     put = Black76Put(F=test_S, K=test_K, T=test_T, r=test_r, sigma=test_sigma)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from .. import BlackScholesStraddleLong, BlackScholesStraddleShort
 
 # Test parameters
@@ -21,6 +23,39 @@ class TestBlackScholesStraddleLong:
                 == getattr(straddle.put1, attr)() + getattr(straddle.call1, attr)()
             )
 
+    def test_get_all_greeks(self):
+        straddle = BlackScholesStraddleLong(
+            test_S, test_K, test_T, test_r, test_sigma, q=0.01
+        )
+        # Fused pass should agree with summing the call and put legs.
+        all_greeks = straddle.get_all_greeks()
+        for key, value in all_greeks.items():
+            expected = (
+                straddle.put1.get_all_greeks()[key]
+                + straddle.call1.get_all_greeks()[key]
+            )
+            np.testing.assert_almost_equal(value, expected, decimal=7)
+
+    def test_get_all_greeks_otm_leg(self):
+        # Fused pass should agree with summing the legs
+        # when the put leg is out-of-the-money.
+        straddle = BlackScholesStraddleLong(70.0, test_K, 0.25, test_r, test_sigma)
+        all_greeks = straddle.get_all_greeks()
+        for key, value in all_greeks.items():
+            expected = (
+                straddle.put1.get_all_greeks()[key]
+                + straddle.call1.get_all_greeks()[key]
+            )
+            np.testing.assert_almost_equal(value, expected, decimal=7)
+
+    def test_get_all_greeks_deep_otm_leg(self):
+        # With a deep out-of-the-money put leg (put price ~1e-300) the fused
+        # pass should stay finite instead of dividing by a cancelled-to-zero
+        # parity price.
+        straddle = BlackScholesStraddleLong(90.0, test_K, 0.1, test_r, 0.05)
+        for value in straddle.get_all_greeks().values():
+            assert np.isfinite(value)
+
 
 class TestBlackScholesStraddleShort:
     def test_individual_methods(self):
@@ -34,3 +69,16 @@ class TestBlackScholesStraddleShort:
                 getattr(straddle, attr)()
                 == -getattr(straddle.put1, attr)() - getattr(straddle.call1, attr)()
             )
+
+    def test_get_all_greeks(self):
+        straddle = BlackScholesStraddleShort(
+            test_S, test_K, test_T, test_r, test_sigma, q=0.01
+        )
+        # Fused pass should agree with summing the negated call and put legs.
+        all_greeks = straddle.get_all_greeks()
+        for key, value in all_greeks.items():
+            expected = (
+                -straddle.put1.get_all_greeks()[key]
+                - straddle.call1.get_all_greeks()[key]
+            )
+            np.testing.assert_almost_equal(value, expected, decimal=7)